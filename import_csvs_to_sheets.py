@@ -24,30 +24,100 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import gspread
 from google.oauth2.service_account import Credentials
+from googleapiclient.discovery import build
+from googleapiclient.http import MediaFileUpload
 import csv
 import sys
 import argparse
 import os
 import glob
 import configparser
+import datetime
+import tempfile
+import threading
 import time
-import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from dateutil import parser as date_parser
+import pandas as pd
+import pytz
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_UTC = pytz.utc
+_EASTERN = pytz.timezone('US/Eastern')
+# Google Sheets serial-number epoch (days since 1899-12-30)
+_SHEETS_EPOCH = datetime.datetime(1899, 12, 30)
+
+# Deletion table stripping everything but ASCII digits; str.translate is a
+# tight C loop, cheaper than the regex engine on short phone strings
+_KEEP_DIGITS = str.maketrans('', '', ''.join(chr(c) for c in range(256) if chr(c) not in '0123456789'))
+
+def use_orjson_session(session):
+    # Pre-serialize request bodies with orjson (a C extension, several
+    # times faster than stdlib json) so big batchUpdate payloads don't
+    # burn CPU in requests' json.dumps. No-op when orjson isn't installed.
+    if orjson is None:
+        return
+    original = session.request
+
+    def request(method, url, *args, json=None, data=None, headers=None, **kwargs):
+        if json is not None and data is None:
+            data = orjson.dumps(json)
+            headers = dict(headers or {})
+            headers['Content-Type'] = 'application/json'
+            json = None
+        return original(method, url, *args, json=json, data=data, headers=headers, **kwargs)
+
+    session.request = request
 
 def setup_google_sheets(credentials_file, scopes):
     creds = Credentials.from_service_account_file(credentials_file, scopes=scopes)
     client = gspread.authorize(creds)
-    return client
+    use_orjson_session(client.http_client.session)
+    return client, creds
+
+class RateLimiter:
+    # Token-bucket limiter shared across upload threads, sized to stay
+    # under the Sheets per-minute write quota
+    def __init__(self, calls_per_minute):
+        self.interval = 60.0 / calls_per_minute
+        self.lock = threading.Lock()
+        self.next_slot = 0.0
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+def get_or_create_workbook(client, name, workbook_id=None, debug=False):
+    if debug:
+        # List accessible spreadsheets: a paginated Drive query over every
+        # file the service account can see, so only do it when asked
+        try:
+            spreadsheets = client.list_spreadsheet_files()
+            print("Accessible spreadsheets:")
+            for s in spreadsheets:
+                print(f"  - {s['name']}")
+        except Exception as e:
+            print(f"Error listing spreadsheets: {e}")
+
+    # A cached id resolves with a single GET; open-by-name does a Drive
+    # listing internally
+    if workbook_id:
+        try:
+            return client.open_by_key(workbook_id)
+        except Exception as e:
+            print(f"Error opening workbook by id '{workbook_id}': {e}; falling back to name lookup")
 
-def get_or_create_workbook(client, name):
-    # Debug: list accessible spreadsheets
-    try:
-        spreadsheets = client.list_spreadsheet_files()
-        print("Accessible spreadsheets:")
-        for s in spreadsheets:
-            print(f"  - {s['name']}")
-    except Exception as e:
-        print(f"Error listing spreadsheets: {e}")
-    
     try:
         return client.open(name)
     except gspread.exceptions.SpreadsheetNotFound:
@@ -57,235 +127,315 @@ def get_or_create_workbook(client, name):
         print(f"Error accessing workbook '{name}': {e}")
         sys.exit(1)
 
-def build_email_phone_map(csv_dir, exclude_columns):
-    email_phone_map = {}
-    csv_files = glob.glob(os.path.join(csv_dir, "*.csv"))
-    for csv_file in csv_files:
-        with open(csv_file, 'r', newline='') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                email = row.get('email', '').strip().lower()
-                phone = row.get('phone', '').strip()
-                digits = re.sub(r'\D', '', phone)
-                if email and len(digits) == 10:
-                    # Always prefer a valid phone if not already set
-                    if email not in email_phone_map:
-                        email_phone_map[email] = f"{digits[0:3]}.{digits[3:6]}.{digits[6:10]}"
-    return email_phone_map
+def parse_csv_file(csv_file):
+    # Parse one CSV into a (header, rows) pair; rows stay plain lists,
+    # skipping DictReader's per-row dict construction (one hashed insert
+    # per column per row). Runs in a worker process, so it must stay
+    # top-level and picklable.
+    # Explicit utf-8 (the platform default is locale-dependent) and a 1 MiB
+    # buffer so multi-MB exports don't go through 8 KiB read() syscalls
+    with open(csv_file, 'r', encoding='utf-8', newline='', buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        return header, list(reader)
+
+# Explicit formats tried before dateutil's generic parser; strptime and
+# fromisoformat are C-implemented and ~10x faster per parse
+_DATE_FORMATS = (
+    '%m/%d/%Y %H:%M:%S',
+    '%m/%d/%Y %I:%M %p',
+    '%m/%d/%Y',
+    '%m/%d/%y',
+)
+
+def detect_date_format(sample):
+    # Pick the parser for a date column from its first non-empty value:
+    # 'iso' for fromisoformat, a strptime pattern, or None for dateutil
+    try:
+        datetime.datetime.fromisoformat(sample.replace('Z', '+00:00'))
+        return 'iso'
+    except (ValueError, TypeError):
+        pass
+    for fmt in _DATE_FORMATS:
+        try:
+            datetime.datetime.strptime(sample, fmt)
+            return fmt
+        except (ValueError, TypeError):
+            continue
+    return None
+
+@lru_cache(maxsize=2**15)
+def to_sheets_serial(value, fmt=None):
+    # Parse a date string and convert it to a Google Sheets serial number
+    # in US/Eastern. Memoized: event CSVs repeat the same timestamps many
+    # times, so repeated strings become an O(1) dict hit.
+    try:
+        if fmt == 'iso':
+            dt = datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+        elif fmt:
+            dt = datetime.datetime.strptime(value, fmt)
+        else:
+            dt = date_parser.parse(value)
+    except (ValueError, TypeError, OverflowError):
+        # Column format didn't hold for this value; fall back to dateutil
+        try:
+            dt = date_parser.parse(value)
+        except Exception:
+            return None
+    try:
+        # If tz-aware, convert to UTC first
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(_UTC)
+        else:
+            dt = _UTC.localize(dt)
+        # Convert to US/Eastern, then to a Sheets serial number
+        dt = dt.astimezone(_EASTERN).replace(tzinfo=None)
+        return (dt - _SHEETS_EPOCH).total_seconds() / 86400.0
+    except Exception:
+        return None
+
+@lru_cache(maxsize=4096)
+def _format_phone(digits):
+    # digits is always a 10-digit string here. Memoized: the same
+    # volunteers recur across event CSVs, so repeated numbers skip the
+    # slicing and join entirely.
+    return '.'.join((digits[:3], digits[3:6], digits[6:]))
 
 def normalize_phone(phone):
-    digits = re.sub(r'\D', '', phone or '')
+    # Cells coming out of pandas may be None/NaN rather than strings
+    phone = phone if isinstance(phone, str) else ''
+    # Fast path: already-clean inputs need no translation at all
+    digits = phone if phone.isdigit() else phone.translate(_KEEP_DIGITS)
     if digits.startswith('1') and len(digits) == 11:
         digits = digits[1:]
     if len(digits) == 10:
-        return f"{digits[0:3]}.{digits[3:6]}.{digits[6:10]}"
+        return _format_phone(digits)
     return None
 
-def qa_phone_numbers(rows, header):
-    # Find the phone and email column indices
-    phone_idx = next((i for i, h in enumerate(header) if 'phone' in h.lower()), None)
-    email_idx = next((i for i, h in enumerate(header) if 'email' in h.lower()), None)
-    if phone_idx is None or email_idx is None:
-        return rows  # Nothing to do
-
-    # First pass: collect valid phone numbers by email
-    email_to_phone = {}
-    for row in rows:
-        email = row[email_idx].strip().lower()
-        phone = normalize_phone(row[phone_idx])
-        if phone:
-            email_to_phone[email] = phone
-
-    # Second pass: fix or discard invalid phone numbers, fill in missing ones
-    fixed_rows = []
-    for row in rows:
-        email = row[email_idx].strip().lower()
-        phone = normalize_phone(row[phone_idx])
-        if not phone:
-            # Try to fill from known valid phones
-            phone = email_to_phone.get(email, '')
-        row[phone_idx] = phone
-        fixed_rows.append(row)
-    return fixed_rows
-
 def qa_phone_numbers_with_global_map(rows, header, global_email_phone_map):
-    phone_idx = next((i for i, h in enumerate(header) if 'phone' in h.lower()), None)
-    email_idx = next((i for i, h in enumerate(header) if 'email' in h.lower()), None)
+    # One lowered {header: index} map; try the exact schema names first and
+    # only fall back to a substring scan for variants like 'phonenumber'
+    hmap = {h.lower(): i for i, h in enumerate(header)}
+    phone_idx = hmap.get('phone')
+    if phone_idx is None:
+        phone_idx = next((i for h, i in hmap.items() if 'phone' in h), None)
+    email_idx = hmap.get('email')
+    if email_idx is None:
+        email_idx = next((i for h, i in hmap.items() if 'email' in h), None)
     if phone_idx is None or email_idx is None:
         return rows
-    fixed_rows = []
+    # Repair rows in place rather than re-materializing the whole list
     for row in rows:
         email = row[email_idx].strip().lower()
         phone = normalize_phone(row[phone_idx])
         if not phone:
             phone = global_email_phone_map.get(email, '')
         row[phone_idx] = phone
-        fixed_rows.append(row)
-    return fixed_rows
+    return rows
 
-def import_csv_to_sheet(workbook, csv_file, global_email_phone_map):
-    sheet_name = os.path.splitext(os.path.basename(csv_file))[0]
-    try:
-        worksheet = workbook.worksheet(sheet_name)
-        worksheet.clear()
-    except gspread.exceptions.WorksheetNotFound:
-        worksheet = workbook.add_worksheet(title=sheet_name, rows=1000, cols=26)
-    
+def prepare_sheet_data(parsed, global_email_phone_map):
     # Columns to exclude
     exclude_columns = {'amountpaid', 'slotitemid', 'hastime', 'status', 'starttime', 'startdate', 'phonetype', 'offset', 'endtime', 'itemmemberid', 'signupid', 'signedupdate', 'enddate', 'waitlist'}
-    
-    import datetime
-    from dateutil import parser as date_parser
-    import pytz
-    with open(csv_file, 'r', newline='') as f:
-        reader = csv.DictReader(f)
-        filtered_data = []
-        for row in reader:
-            filtered_row = {k: v for k, v in row.items() if k not in exclude_columns}
-            for key in list(filtered_row.keys()):
-                # Remove 'string' from field names
-                if 'string' in key:
-                    new_key = key.replace('string', '').replace('__', '_').strip('_')
-                    filtered_row[new_key] = filtered_row.pop(key)
-            for key in filtered_row:
-                if 'phone' in key.lower():
-                    filtered_row[key] = normalize_phone(filtered_row[key])
-                # Format date fields as Google Sheets serial numbers (convert UTC to US/Eastern)
-                if 'date' in key.lower() and filtered_row[key]:
-                    try:
-                        dt = date_parser.parse(filtered_row[key])
-                        # If tz-aware, convert to UTC first
-                        if dt.tzinfo is not None:
-                            dt = dt.astimezone(pytz.utc)
-                        else:
-                            dt = pytz.utc.localize(dt)
-                        # Convert to US/Eastern
-                        eastern = pytz.timezone('US/Eastern')
-                        dt = dt.astimezone(eastern).replace(tzinfo=None)
-                        # Convert to Google Sheets serial number (days since 1899-12-30)
-                        epoch = datetime.datetime(1899, 12, 30)
-                        delta = dt - epoch
-                        filtered_row[key] = delta.days + (delta.seconds + delta.microseconds / 1e6) / 86400
-                    except Exception:
-                        pass
-            filtered_data.append(filtered_row)
-
-    # QA phone numbers using the global map
-    if filtered_data:
-        headers = list(filtered_data[0].keys())
-        filtered_data = qa_phone_numbers_with_global_map(
-            [list(row.values()) for row in filtered_data],
-            headers,
-            global_email_phone_map
-        )
-        data = [headers] + filtered_data
-        
+
+    header, rows = parsed
+    if not rows:
+        return None, None
+
+    # Pad rows shorter than the header (csv.reader keeps them ragged) so
+    # the missing cells come through as '' rather than NaN
+    width = len(header)
+    if any(len(r) < width for r in rows):
+        rows = [r + [''] * (width - len(r)) if len(r) < width else r for r in rows]
+
+    # Vectorize the per-row transform with pandas: the frame is built from
+    # the rows already cached in main, so each CSV is still read only once.
+    df = pd.DataFrame(rows, columns=header)
+    df = df.drop(columns=[c for c in df.columns if c in exclude_columns])
+    # Renamed 'string' columns keep their old position at the end of the row
+    plain = [c for c in df.columns if 'string' not in c]
+    renamed = [c for c in df.columns if 'string' in c]
+    df = df[plain + renamed]
+    df.columns = plain + [c.replace('string', '').replace('__', '_').strip('_')
+                          for c in renamed]
+    phone_cols = [c for c in df.columns if 'phone' in c.lower()]
+    date_cols = [c for c in df.columns if 'date' in c.lower()]
+
+    for c in phone_cols:
+        digits = df[c].fillna('').astype(str).str.replace(r'\D', '', regex=True)
+        digits = digits.where(~(digits.str.startswith('1') & (digits.str.len() == 11)),
+                              digits.str.slice(1))
+        formatted = (digits.str.slice(0, 3) + '.' + digits.str.slice(3, 6)
+                     + '.' + digits.str.slice(6, 10))
+        df[c] = formatted.where(digits.str.len() == 10, None)
+
+    # Format date fields as Google Sheets serial numbers (convert UTC to US/Eastern)
+    for c in date_cols:
+        raw = df[c]
+        dt = pd.to_datetime(raw, utc=True, errors='coerce')
+        dt = dt.dt.tz_convert('US/Eastern').dt.tz_localize(None)
+        serial = (dt - pd.Timestamp(_SHEETS_EPOCH)) / pd.Timedelta(days=1)
+        out = serial.astype(object).where(serial.notna(), raw)
+        # Odd formats pandas coerced to NaT go through the scalar parser
+        failed = serial.isna() & raw.notna() & (raw != '')
+        if failed.any():
+            fmt = detect_date_format(str(raw[failed].iloc[0]))
+            for idx in raw.index[failed]:
+                s = to_sheets_serial(str(raw[idx]), fmt)
+                if s is not None:
+                    out[idx] = s
+        df[c] = out
+
+    # QA phone numbers using the global map. Scrub NaN/None cells to ''
+    # first: csv.writer would otherwise emit them as the literal text
+    # 'nan'. Materialize the rows once; the QA pass mutates them in place.
+    headers = list(df.columns)
+    filtered_data = qa_phone_numbers_with_global_map(
+        df.where(df.notna(), '').values.tolist(),
+        headers,
+        global_email_phone_map
+    )
+    return headers, filtered_data
+
+def upload_csv_as_sheet(drive, sheets, workbook_id, sheet_name, headers, rows, limiter):
+    # Write the prepared rows to a temp CSV and let Drive's server-side
+    # importer convert it, instead of pushing every cell as JSON through
+    # the Sheets API. The converted sheet is copied into the workbook.
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', newline='',
+                                     suffix='.csv', delete=False,
+                                     buffering=1 << 20) as tmp:
+        writer = csv.writer(tmp)
+        writer.writerow(headers)
+        writer.writerows(rows)
+        tmp_path = tmp.name
+    try:
+        media = MediaFileUpload(tmp_path, mimetype='text/csv')
+        limiter.wait()
+        converted = drive.files().create(
+            body={'name': sheet_name, 'mimeType': 'application/vnd.google-apps.spreadsheet'},
+            media_body=media,
+            fields='id'
+        ).execute()
+        converted_id = converted['id']
         try:
-            worksheet.update(values=data, range_name='A1')
-            # Add filter view and banding for table-like appearance
-            num_rows = len(data)
-            num_cols = len(data[0]) if data else 0
-            if num_rows > 1 and num_cols > 0:
-                requests = [
-                    {
-                        "addFilterView": {
-                            "filter": {
-                                "range": {
-                                    "sheetId": worksheet.id,
-                                    "startRowIndex": 0,
-                                    "endRowIndex": num_rows,
-                                    "startColumnIndex": 0,
-                                    "endColumnIndex": num_cols
+            source_sheet = sheets.spreadsheets().get(
+                spreadsheetId=converted_id, fields='sheets.properties.sheetId'
+            ).execute()['sheets'][0]['properties']['sheetId']
+            limiter.wait()
+            copied = sheets.spreadsheets().sheets().copyTo(
+                spreadsheetId=converted_id, sheetId=source_sheet,
+                body={'destinationSpreadsheetId': workbook_id}
+            ).execute()
+        finally:
+            # The converted spreadsheet is only a staging area
+            drive.files().delete(fileId=converted_id).execute()
+    finally:
+        os.unlink(tmp_path)
+    return copied['sheetId']
+
+def upload_worker(creds, workbook_id, csv_file, headers, data_rows, limiter):
+    # Runs in a thread pool; each thread builds its own discovery clients
+    # because googleapiclient's HTTP session is not thread-safe
+    sheet_name = os.path.splitext(os.path.basename(csv_file))[0]
+    if headers is None:
+        return sheet_name, None, None, 0
+    try:
+        drive = build('drive', 'v3', credentials=creds)
+        sheets = build('sheets', 'v4', credentials=creds)
+        new_id = upload_csv_as_sheet(drive, sheets, workbook_id, sheet_name, headers, data_rows, limiter)
+    except Exception as e:
+        # One failed upload (quota, conversion error) shouldn't abort the
+        # run; report it and let the surviving sheets get their batch
+        print(f"Error uploading {csv_file} to sheet {sheet_name}: {e}")
+        return sheet_name, headers, None, 0
+    return sheet_name, headers, new_id, len(data_rows)
+
+def build_format_requests(sheet_id, headers, num_rows):
+    # Filter view and date-column formatting for one imported sheet
+    requests = []
+    num_cols = len(headers)
+    if num_rows > 1 and num_cols > 0:
+        requests.append({
+            "addFilterView": {
+                "filter": {
+                    "range": {
+                        "sheetId": sheet_id,
+                        "startRowIndex": 0,
+                        "endRowIndex": num_rows,
+                        "startColumnIndex": 0,
+                        "endColumnIndex": num_cols
+                    }
+                }
+            }
+        })
+        # Add date-time formatting for date columns
+        for i, header in enumerate(headers):
+            if 'date' in header.lower():
+                requests.append({
+                    "repeatCell": {
+                        "range": {
+                            "sheetId": sheet_id,
+                            "startRowIndex": 1,  # skip header
+                            "endRowIndex": num_rows,
+                            "startColumnIndex": i,
+                            "endColumnIndex": i + 1
+                        },
+                        "cell": {
+                            "userEnteredFormat": {
+                                "numberFormat": {
+                                    "type": "DATE_TIME"
                                 }
                             }
-                        }
+                        },
+                        "fields": "userEnteredFormat.numberFormat"
                     }
-                ]
-                # Add date-time formatting for date columns
-                for i, header in enumerate(headers):
-                    if 'date' in header.lower():
-                        requests.append({
-                            "repeatCell": {
-                                "range": {
-                                    "sheetId": worksheet.id,
-                                    "startRowIndex": 1,  # skip header
-                                    "endRowIndex": num_rows,
-                                    "startColumnIndex": i,
-                                    "endColumnIndex": i + 1
-                                },
-                                "cell": {
-                                    "userEnteredFormat": {
-                                        "numberFormat": {
-                                            "type": "DATE_TIME"
-                                        }
-                                    }
-                                },
-                                "fields": "userEnteredFormat.numberFormat"
-                            }
-                        })
-                workbook.batch_update({"requests": requests})
-            print(f"Imported {csv_file} to sheet {sheet_name} (columns filtered, phones normalized, table created)")
-        except Exception as e:
-            print(f"Error updating {sheet_name}: {e}")
-            return
-        # Skip formatting to reduce API calls
-        # num_rows = len(data)
-        # num_cols = len(data[0]) if data else 0
-        # if num_rows > 0 and num_cols > 0:
-        #     range_str = f'A1:{chr(ord("A") + num_cols - 1)}{num_rows}'
-        #     requests = [{
-        #         "range": range_str,
-        #         "borders": {
-        #             "top": {"style": "SOLID"},
-        #             "bottom": {"style": "SOLID"},
-        #             "left": {"style": "SOLID"},
-        #             "right": {"style": "SOLID"},
-        #             "innerHorizontal": {"style": "SOLID"},
-        #             "innerVertical": {"style": "SOLID"}
-        #         }
-        #     }]
-        #     workbook.batch_update({"requests": requests})
-
-def build_global_email_phone_map(csv_dir, exclude_columns):
+                })
+    return requests
+
+def build_global_email_phone_map(parsed_rows):
     email_phone_map = {}
-    csv_files = glob.glob(os.path.join(csv_dir, "*.csv"))
-    for csv_file in csv_files:
-        with open(csv_file, 'r', newline='') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                email = row.get('email', '').strip().lower()
-                phone = row.get('phone', '').strip()
-                digits = re.sub(r'\D', '', phone)
-                if email and len(digits) == 10:
-                    # Always prefer a valid phone if not already set
-                    if email not in email_phone_map:
-                        email_phone_map[email] = f"{digits[0:3]}.{digits[3:6]}.{digits[6:10]}"
+    for header, rows in parsed_rows.values():
+        # Resolve column positions once per file instead of hashing
+        # column names on every row
+        idx = {h: i for i, h in enumerate(header)}
+        email_idx = idx.get('email')
+        phone_idx = idx.get('phone')
+        # Email-only rosters can't contribute phone numbers; skip the
+        # whole file instead of scanning rows that can never match
+        if email_idx is None or phone_idx is None:
+            continue
+        for row in rows:
+            # Ragged rows may be missing either cell
+            if email_idx >= len(row) or phone_idx >= len(row):
+                continue
+            email = row[email_idx].strip().lower()
+            phone = row[phone_idx].strip()
+            digits = phone if phone.isdigit() else phone.translate(_KEEP_DIGITS)
+            if email and len(digits) == 10:
+                # Always prefer a valid phone if not already set
+                if email not in email_phone_map:
+                    email_phone_map[email] = _format_phone(digits)
     return email_phone_map
 
-def sort_sheets_alphabetically(workbook):
-    # Get all worksheets and their titles
-    sheets = workbook.worksheets()
-    # Sort by title
-    sorted_sheets = sorted(sheets, key=lambda ws: ws.title.lower())
-    # Reorder sheets in the workbook
+def sort_sheets_alphabetically(sheet_ids):
+    # Build reordering requests from the {title: sheetId} map, sorted by title
     requests = []
-    for idx, ws in enumerate(sorted_sheets):
+    for idx, title in enumerate(sorted(sheet_ids, key=str.lower)):
         requests.append({
             "updateSheetProperties": {
                 "properties": {
-                    "sheetId": ws.id,
+                    "sheetId": sheet_ids[title],
                     "index": idx
                 },
                 "fields": "index"
             }
         })
-    if requests:
-        workbook.batch_update({"requests": requests})
+    return requests
 
 def main():
     parser = argparse.ArgumentParser(description="Import CSVs to Google Sheets with formatting and QA.")
     parser.add_argument('--config-dir', type=str, default='.', help='Directory containing config.ini and credentials.json')
     parser.add_argument('--csv-dir', type=str, default='/home/ruddy/data/agimba/2025', help='Directory containing CSV files to import')
+    parser.add_argument('--debug', action='store_true', help='List all spreadsheets accessible to the service account')
     args = parser.parse_args()
 
     config_dir = args.config_dir
@@ -310,9 +460,16 @@ def main():
         print(f"Error: Credentials file {credentials_file} not found.")
         sys.exit(1)
 
-    client = setup_google_sheets(credentials_file, scopes)
+    client, creds = setup_google_sheets(credentials_file, scopes)
     workbook_name = "2025-2026-volunteers"
-    workbook = get_or_create_workbook(client, workbook_name)
+    workbook = get_or_create_workbook(client, workbook_name,
+                                      config.get('workbook_id'), args.debug)
+    if config.get('workbook_id') != workbook.id:
+        # Persist the resolved spreadsheet id so later runs skip the
+        # Drive listing that open-by-name performs
+        cp['sheets']['workbook_id'] = workbook.id
+        with open(config_path, 'w') as f:
+            cp.write(f)
 
     csv_dir = args.csv_dir
     csv_files = glob.glob(os.path.join(csv_dir, "*.csv"))
@@ -321,7 +478,6 @@ def main():
         return
 
     # Filter out CSV files older than 30 days
-    import datetime
     cutoff = time.time() - 30 * 86400
     fresh_files = []
     for f in csv_files:
@@ -334,17 +490,62 @@ def main():
         print("No CSV files newer than 30 days found.")
         return
 
-    # Build global email-to-phone map before processing files
-    exclude_columns = {'amountpaid', 'slotitemid', 'hastime', 'status', 'starttime', 'startdate', 'phonetype', 'offset', 'endtime', 'itemmemberid', 'signupid', 'signedupdate', 'enddate', 'waitlist'}
-    global_email_phone_map = build_global_email_phone_map(csv_dir, exclude_columns)
+    # Parse and transform the CSVs in a process pool: the per-file work
+    # (CSV parse, date parse, phone cleanup) is CPU-bound Python, so
+    # separate processes sidestep the GIL. The global email-to-phone map
+    # is reduced in the main process between the two phases and broadcast
+    # to the transform workers.
+    with ProcessPoolExecutor() as pool:
+        parsed_rows = dict(zip(csv_files, pool.map(parse_csv_file, csv_files)))
+        global_email_phone_map = build_global_email_phone_map(parsed_rows)
+        prepared = dict(zip(csv_files, pool.map(
+            prepare_sheet_data,
+            (parsed_rows[f] for f in csv_files),
+            repeat(global_email_phone_map)
+        )))
 
-    for csv_file in csv_files:
-        import_csv_to_sheet(workbook, csv_file, global_email_phone_map)
-        time.sleep(1)  # Delay to avoid quota issues
+    # Upload the prepared CSVs through Drive's import conversion concurrently
+    # (the calls are network-bound), then fix up names and formatting in one
+    # batchUpdate at the end.
+    existing = {ws.title: ws.id for ws in workbook.worksheets()}
+    sheet_ids = dict(existing)
+    limiter = RateLimiter(calls_per_minute=60)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(
+            lambda f: upload_worker(creds, workbook.id, f, *prepared[f], limiter),
+            csv_files
+        ))
 
-    print(f"All CSVs imported to workbook '{workbook_name}'")
-    # Sort sheets alphabetically
-    sort_sheets_alphabetically(workbook)
+    requests = []
+    for csv_file, (sheet_name, headers, new_id, num_rows) in zip(csv_files, results):
+        if headers is None:
+            print(f"Skipping {os.path.basename(csv_file)} (no rows)")
+            continue
+        if new_id is None:
+            # Upload failed; already reported by the worker
+            continue
+        # Replace any previous sheet of the same name, then claim its title
+        # (the copy arrives as "Copy of <name>")
+        if sheet_name in existing:
+            requests.append({"deleteSheet": {"sheetId": existing[sheet_name]}})
+        requests.append({
+            "updateSheetProperties": {
+                "properties": {"sheetId": new_id, "title": sheet_name},
+                "fields": "title"
+            }
+        })
+        sheet_ids[sheet_name] = new_id
+        requests.extend(build_format_requests(new_id, headers, num_rows + 1))
+        print(f"Uploaded {csv_file} to sheet {sheet_name} (columns filtered, phones normalized)")
+    # Sort sheets alphabetically as part of the same batch
+    requests.extend(sort_sheets_alphabetically(sheet_ids))
+
+    try:
+        workbook.batch_update({"requests": requests})
+    except Exception as e:
+        print(f"Error updating workbook '{workbook_name}': {e}")
+        sys.exit(1)
+    print(f"All CSVs imported to workbook '{workbook_name}' in one batch update")
     print("Sheets sorted alphabetically.")
 
 if __name__ == "__main__":
@@ -7,7 +7,9 @@ setup(
     install_requires=[
         'gspread',
         'google-auth',
+        'google-api-python-client',
         'python-dateutil',
+        'pandas',
         'pytz',
     ],
     entry_points={